@@ -0,0 +1,3 @@
+# Version1/conftest.py
+# Lets pytest import the `core` package when run from Version1/:
+#     python -m pytest -q
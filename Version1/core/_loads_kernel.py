@@ -0,0 +1,115 @@
+# core/_loads_kernel.py
+"""
+Numba-compiled shear/moment kernels used by core/loads.py.
+
+The loads come in as flat float64 arrays (one array per attribute) so the
+whole V(x), M(x) evaluation is a single compiled loop over x, without any
+temporary arrays per load. Importing this module requires numba; loads.py
+falls back to its NumPy implementation when it is not installed.
+
+Besides the general kernel there are two specialized variants for load
+cases with only point loads or only UDLs, so the common cases compile to
+straight-line loops that never touch the empty load category.
+"""
+
+import numpy as np
+from numba import njit
+
+
+# Explicit signatures: compiled when the module is imported (or loaded from
+# the on-disk cache), instead of on the first analysis call.
+_SHEAR_MOMENT_SIG = "UniTuple(f8[:], 2)(f8[:], f8, f8, f8, f8[:], f8[:], f8[:], f8[:], f8[:])"
+_SHEAR_MOMENT_POINT_SIG = "UniTuple(f8[:], 2)(f8[:], f8, f8, f8, f8[:], f8[:])"
+_SHEAR_MOMENT_UDL_SIG = "UniTuple(f8[:], 2)(f8[:], f8, f8, f8, f8[:], f8[:], f8[:])"
+
+
+@njit(inline="always", fastmath=True)
+def _point_terms(xi, v, m, pl_vals, pl_pos):
+    """Add the point loads (downward) acting left of xi to v, m."""
+    for k in range(pl_vals.shape[0]):
+        if xi >= pl_pos[k]:
+            v += pl_vals[k]
+            m += pl_vals[k] * (xi - pl_pos[k])
+    return v, m
+
+
+@njit(inline="always", fastmath=True)
+def _udl_terms(xi, v, m, udl_w, udl_a, udl_b):
+    """
+    Add the UDLs (downward) to v, m, using the active length of [a,b]
+    that lies <= xi. Written branch-free (clamp to [0, b-a]) so LLVM can
+    vectorize it.
+    """
+    for k in range(udl_w.shape[0]):
+        l = min(max(xi - udl_a[k], 0.0), udl_b[k] - udl_a[k])
+        v += udl_w[k] * l
+        m += 0.5 * udl_w[k] * l * l
+    return v, m
+
+
+@njit(_SHEAR_MOMENT_SIG, cache=True, fastmath=True)
+def _shear_moment(x, RA, RB, L, pl_vals, pl_pos, udl_w, udl_a, udl_b):
+    """
+    Shear V(x) [kN] and bending moment M(x) [kNm] along a simply
+    supported beam with reactions RA, RB and span L.
+
+    pl_vals, pl_pos      : point load values [kN] and positions [m]
+    udl_w, udl_a, udl_b  : UDL intensities [kN/m], starts and ends [m]
+    """
+    n = x.shape[0]
+    V = np.empty(n)
+    M = np.empty(n)
+
+    for i in range(n):
+        xi = x[i]
+        v, m = _point_terms(xi, RA, RA * xi, pl_vals, pl_pos)
+        v, m = _udl_terms(xi, v, m, udl_w, udl_a, udl_b)
+
+        # RB as a point reaction at x=L (upward), zero lever arm
+        if xi >= L:
+            v += RB
+
+        V[i] = v
+        M[i] = m
+
+    return V, M
+
+
+@njit(_SHEAR_MOMENT_POINT_SIG, cache=True, fastmath=True)
+def _shear_moment_point(x, RA, RB, L, pl_vals, pl_pos):
+    """_shear_moment for a load case with point loads only."""
+    n = x.shape[0]
+    V = np.empty(n)
+    M = np.empty(n)
+
+    for i in range(n):
+        xi = x[i]
+        v, m = _point_terms(xi, RA, RA * xi, pl_vals, pl_pos)
+
+        if xi >= L:
+            v += RB
+
+        V[i] = v
+        M[i] = m
+
+    return V, M
+
+
+@njit(_SHEAR_MOMENT_UDL_SIG, cache=True, fastmath=True)
+def _shear_moment_udl(x, RA, RB, L, udl_w, udl_a, udl_b):
+    """_shear_moment for a load case with UDLs only."""
+    n = x.shape[0]
+    V = np.empty(n)
+    M = np.empty(n)
+
+    for i in range(n):
+        xi = x[i]
+        v, m = _udl_terms(xi, RA, RA * xi, udl_w, udl_a, udl_b)
+
+        if xi >= L:
+            v += RB
+
+        V[i] = v
+        M[i] = m
+
+    return V, M
@@ -1,10 +1,26 @@
 # core/co2_calc.py
+import csv
 from dataclasses import dataclass
-import pandas as pd
+import numpy as np
 from pathlib import Path
 
+from .deflection import max_deflection_vec
+
 STEEL_CO2_KG_PER_KG = 1.9  # kg CO2 per kg steel
 
+# Columns the materials CSV must provide
+MATERIALS_COLUMNS = ("profile", "mass_kg_per_m", "W_cm3", "I_cm4")
+
+
+def bending_resistance_kNm(W_cm3, fy_MPa: float = 355.0, gamma_M0: float = 1.0):
+    """
+    Bending resistance M_Rd [kNm] for one W_cm3 or an array of them.
+
+    Formula (unit-consistent):
+        M_Rd,kNm = W_cm3 * fy_MPa / (gamma_M0 * 1000)
+    """
+    return W_cm3 * fy_MPa / (gamma_M0 * 1000.0)
+
 
 @dataclass
 class BeamSelection:
@@ -16,26 +32,67 @@ class BeamSelection:
 class MaterialsDB:
     def __init__(self, csv_path: str | Path):
         self.csv_path = Path(csv_path)
-        self.df = pd.read_csv(self.csv_path)
 
-        required_cols = {"profile", "mass_kg_per_m"}
-        missing = required_cols - set(self.df.columns)
-        if missing:
+        with open(self.csv_path, newline="", encoding="utf-8-sig") as file:
+            reader = csv.DictReader(file)
+
+            found = reader.fieldnames or []
+            missing = set(MATERIALS_COLUMNS) - set(found)
+            if missing:
+                raise ValueError(
+                    f"Materials CSV is missing required columns: {missing}. "
+                    f"Found columns: {list(found)}"
+                )
+
+            # Profile -> section properties, built once so lookups are O(1).
+            # Duplicated profiles keep their first row, as a scan would.
+            self._table: dict[str, dict[str, float]] = {}
+            for row in reader:
+                profile = row["profile"]
+                if profile in self._table:
+                    continue
+                self._table[profile] = {
+                    col: self._parse_value(row, col)
+                    for col in MATERIALS_COLUMNS[1:]
+                }
+
+        # The same table as contiguous float64 columns for candidate sweeps
+        rows = self._table.values()
+        n = len(self._table)
+        self._profiles = np.array(list(self._table), dtype=object)
+        self._mass_per_m = np.fromiter(
+            (r["mass_kg_per_m"] for r in rows), dtype=np.float64, count=n
+        )
+        self._W = np.fromiter((r["W_cm3"] for r in rows), dtype=np.float64, count=n)
+        self._I = np.fromiter((r["I_cm4"] for r in rows), dtype=np.float64, count=n)
+
+    def _parse_value(self, row: dict, col: str) -> float:
+        """
+        Numeric cell of the materials CSV. Empty cells become NaN;
+        anything else that is not a number is an error.
+        """
+        value = (row[col] or "").strip()
+        if not value:
+            return float("nan")
+        try:
+            return float(value)
+        except ValueError:
             raise ValueError(
-                f"Materials CSV is missing required columns: {missing}. "
-                f"Found columns: {list(self.df.columns)}"
-            )
+                f"Profile '{row['profile']}' in {self.csv_path} has a "
+                f"non-numeric {col}: {value!r}"
+            ) from None
 
-    def get_section_row(self, profile: str) -> pd.Series:
-        rows = self.df.loc[self.df["profile"] == profile]
-        if rows.empty:
-            raise KeyError(f"Profile '{profile}' not found in {self.csv_path}")
-        return rows.iloc[0]
+    def get_section_row(self, profile: str) -> dict[str, float]:
+        try:
+            return self._table[profile]
+        except KeyError:
+            raise KeyError(
+                f"Profile '{profile}' not found in {self.csv_path}"
+            ) from None
 
     def beam_mass_kg(self, beam: BeamSelection) -> float:
         row = self.get_section_row(beam.profile)
-        mass_per_m = float(row["mass_kg_per_m"])
-        return mass_per_m * beam.length_m
+        return row["mass_kg_per_m"] * beam.length_m
 
     def beam_co2_kg(self, beam: BeamSelection) -> float:
         mass_kg = self.beam_mass_kg(beam)
@@ -53,13 +110,60 @@ class MaterialsDB:
         Uses:
             W_cm3 from the CSV (elastic/plastic section modulus in cm^3)
             fy_MPa as yield strength [MPa = N/mm^2]
-        Formula (unit-consistent):
-            M_Rd,kNm = W_cm3 * fy_MPa / (gamma_M0 * 1000)
+        Formula: see bending_resistance_kNm
         """
         row = self.get_section_row(beam.profile)
-        W_cm3 = float(row["W_cm3"])
-        M_Rd_kNm = W_cm3 * fy_MPa / (gamma_M0 * 1000.0)
-        return M_Rd_kNm
+        return bending_resistance_kNm(row["W_cm3"], fy_MPa, gamma_M0)
+
+    def evaluate_candidates(
+        self,
+        span_m: float,
+        M_Ed_kNm: float,
+        q_kN_per_m: float = 0.0,
+        P_kN: float = 0.0,
+        fy_MPa: float = 355.0,
+        gamma_M0: float = 1.0,
+        deflection_ratio: float = 250.0,
+    ) -> dict[str, np.ndarray]:
+        """
+        Bending, deflection and CO2 check of every profile in the table.
+
+        All profiles are evaluated at once on the cached column arrays
+        instead of one BeamSelection at a time. Deflection uses the same
+        superposition as max_deflection_simply_supported (full-span UDL
+        q_kN_per_m plus a midspan point load P_kN, see max_deflection_vec)
+        and is limited to L / deflection_ratio.
+
+        Returns dict of arrays, one entry per profile:
+            profile, M_Rd_kNm, utilization, w_max_mm, deflection_ok,
+            mass_kg, co2_kg, passes
+        """
+        W_cm3 = self._W
+        I_cm4 = self._I
+        mass_per_m = self._mass_per_m
+        w_limit_mm = span_m * 1000.0 / deflection_ratio
+
+        # Bending capacity (ULS)
+        M_Rd_kNm = bending_resistance_kNm(W_cm3, fy_MPa, gamma_M0)
+        utilization = M_Ed_kNm / M_Rd_kNm
+
+        # Deflection (SLS)
+        w_max_mm = max_deflection_vec(span_m, I_cm4, q_kN_per_m, P_kN)
+        deflection_ok = w_max_mm <= w_limit_mm
+
+        mass_kg = mass_per_m * span_m
+        co2_kg = mass_kg * STEEL_CO2_KG_PER_KG
+
+        return {
+            "profile": self._profiles,
+            "M_Rd_kNm": M_Rd_kNm,
+            "utilization": utilization,
+            "w_max_mm": w_max_mm,
+            "deflection_ok": deflection_ok,
+            "mass_kg": mass_kg,
+            "co2_kg": co2_kg,
+            "passes": (utilization <= 1.0) & deflection_ok,
+        }
 
     def summary(self, beam: BeamSelection) -> dict:
         row = self.get_section_row(beam.profile)
@@ -70,9 +174,9 @@ class MaterialsDB:
             "profile": beam.profile,
             "length_m": beam.length_m,
             "material": beam.material,
-            "mass_kg_per_m": float(row["mass_kg_per_m"]),
+            "mass_kg_per_m": row["mass_kg_per_m"],
             "mass_kg": mass_kg,
             "co2_kg": co2_kg,
-            "W_cm3": float(row["W_cm3"]),
-            "I_cm4": float(row["I_cm4"]),
+            "W_cm3": row["W_cm3"],
+            "I_cm4": row["I_cm4"],
         }
@@ -1,5 +1,7 @@
 # core/deflection.py
 
+import numpy as np
+
 E_STEEL_MPA = 210_000.0  # Young's modulus of steel [MPa = N/mm^2]
 
 
@@ -39,3 +41,27 @@ def max_deflection_simply_supported(
         w_P = (P_N * L_mm**3) / (48 * E_STEEL_MPA * I_mm4)
 
     return w_q + w_P
+
+
+def max_deflection_vec(
+    span_m: float,
+    I_cm4,
+    q_kN_per_m: float = 0.0,
+    P_kN: float = 0.0,
+) -> np.ndarray:
+    """
+    Same as max_deflection_simply_supported, for an array of I values [mm].
+
+    Only I_cm4 varies between candidate profiles, so the UDL and
+    point-load terms are folded into one constant and divided by I.
+
+    Returns:
+        w_max_mm array, one entry per I_cm4
+    """
+    L_mm = span_m * 1000.0
+    I_mm4 = np.asarray(I_cm4, dtype=np.float64) * 1e4   # cm^4 -> mm^4
+
+    k_q = 5 * q_kN_per_m * L_mm**4 / (384 * E_STEEL_MPA)      # kN/m == N/mm
+    k_P = P_kN * 1000.0 * L_mm**3 / (48 * E_STEEL_MPA)        # kN -> N
+
+    return (k_q + k_P) / I_mm4
@@ -2,9 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Iterable, Tuple
+from typing import List, Iterable, NamedTuple, Tuple
 import numpy as np
 
+try:
+    from ._loads_kernel import (
+        _shear_moment,
+        _shear_moment_point,
+        _shear_moment_udl,
+    )
+except ImportError:  # numba not installed: use the NumPy path below
+    _shear_moment = _shear_moment_point = _shear_moment_udl = None
+
 
 @dataclass
 class PointLoad:
@@ -40,6 +49,37 @@ class LoadCase:
     gamma: float = 1.0  # EC load factor
 
 
+class _LoadArrays(NamedTuple):
+    """Loads of a case as flat float64 arrays (structure of arrays)."""
+    pl_vals: np.ndarray
+    pl_pos: np.ndarray
+    udl_w: np.ndarray
+    udl_a: np.ndarray
+    udl_b: np.ndarray
+
+
+def _load_arrays(lc: LoadCase) -> _LoadArrays:
+    """
+    Current loads of a case as arrays. Built from the lists on every call,
+    so changes to lc.point_loads / lc.udls are always picked up.
+    """
+    n_pl = len(lc.point_loads)
+    n_udl = len(lc.udls)
+    return _LoadArrays(
+        pl_vals=np.fromiter(
+            (p.value_kN for p in lc.point_loads), dtype=np.float64, count=n_pl
+        ),
+        pl_pos=np.fromiter(
+            (p.position_m for p in lc.point_loads), dtype=np.float64, count=n_pl
+        ),
+        udl_w=np.fromiter(
+            (w.intensity_kN_per_m for w in lc.udls), dtype=np.float64, count=n_udl
+        ),
+        udl_a=np.fromiter((w.start_m for w in lc.udls), dtype=np.float64, count=n_udl),
+        udl_b=np.fromiter((w.end_m for w in lc.udls), dtype=np.float64, count=n_udl),
+    )
+
+
 def combine_load_cases(
     cases: Iterable[LoadCase],
     combination_factors: dict[str, float],
@@ -70,22 +110,15 @@ def combine_load_cases(
 
         factor = psi * lc.gamma
 
-        for pl in lc.point_loads:
-            combined_point_loads.append(
-                PointLoad(
-                    value_kN=pl.value_kN * factor,
-                    position_m=pl.position_m,
-                )
-            )
-
-        for w in lc.udls:
-            combined_udls.append(
-                UDL(
-                    intensity_kN_per_m=w.intensity_kN_per_m * factor,
-                    start_m=w.start_m,
-                    end_m=w.end_m,
-                )
-            )
+        combined_point_loads.extend(
+            [PointLoad(pl.value_kN * factor, pl.position_m) for pl in lc.point_loads]
+        )
+        combined_udls.extend(
+            [
+                UDL(w.intensity_kN_per_m * factor, w.start_m, w.end_m)
+                for w in lc.udls
+            ]
+        )
 
     return LoadCase(
         name=name,
@@ -96,37 +129,70 @@ def combine_load_cases(
     )
 
 
-def _reactions_simply_supported(lc: LoadCase) -> Tuple[float, float]:
+def _reactions_simply_supported(L: float, loads: _LoadArrays) -> Tuple[float, float]:
     """
-    Statics for a simply supported beam:
+    Statics for a simply supported beam of span L:
     Returns (RA_kN, RB_kN) = reactions at left and right supports.
     Sign convention: upward positive.
     """
-    L = lc.span_m
-    RA = 0.0
-    RB = 0.0
-
-    # Point loads
-    for pl in lc.point_loads:
-        P = pl.value_kN
-        a = pl.position_m  # from left
-        # Total vertical equilibrium + moments about left:
-        # For a downward load (negative P), RA and RB should be positive.
-        RB += -P * a / L
-        RA += -P - (-P * a / L)
-
-    # UDLs
-    for w in lc.udls:
-        w_int = w.intensity_kN_per_m
-        a = w.start_m
-        b = w.end_m
+    P, a = loads.pl_vals, loads.pl_pos  # point loads, distance from left
+    Lw = loads.udl_b - loads.udl_a
+    W = loads.udl_w * Lw  # total load of each UDL (kN)
+    x_res = loads.udl_a + 0.5 * Lw  # resultant locations
+
+    # Moments about left give RB, total vertical equilibrium gives RA.
+    # For a downward load (negative P), RA and RB should be positive.
+    RB = -(P @ a + W @ x_res) / L
+    RA = -P.sum() - W.sum() - RB
+
+    return float(RA), float(RB)
+
+
+def _shear_moment_numpy(
+    x: np.ndarray,
+    RA: float,
+    RB: float,
+    L: float,
+    loads: _LoadArrays,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    NumPy version of the shear/moment kernel, used when numba is not
+    available. Returns (V_kN, M_kNm) at the positions x.
+    """
+    # Add reactions (upward)
+    V = np.full_like(x, RA)
+    M = RA * x
+
+    # Point loads (downward), P is negative if downward.
+    # With the loads sorted by position, the ones acting at x (a <= x) are
+    # the first k of them, so V and M follow from running sums of P and P*a:
+    #   V += sum(P),  M += sum(P * (x - a)) = x * sum(P) - sum(P * a)
+    if loads.pl_vals.size:
+        order = np.argsort(loads.pl_pos, kind="stable")
+        a = loads.pl_pos[order]
+        P = loads.pl_vals[order]
+        cum_P = np.concatenate(([0.0], np.cumsum(P)))
+        cum_Pa = np.concatenate(([0.0], np.cumsum(P * a)))
+
+        k = np.searchsorted(a, x, side="right")
+        V += cum_P[k]
+        M += cum_P[k] * x - cum_Pa[k]
+
+    # UDLs (downward)
+    # For each segment [a,b], intensity w, we integrate w over the part
+    # of [a,b] that lies <= x: zero before a, x - a inside, b - a past b.
+    for w_int, a, b in zip(loads.udl_w, loads.udl_a, loads.udl_b):
         Lw = b - a
-        W = w_int * Lw  # total load (kN)
-        x_res = a + Lw / 2.0  # resultant location
-        RB += -W * x_res / L
-        RA += -W - (-W * x_res / L)
 
-    return RA, RB
+        l = np.clip(x - a, 0.0, Lw)
+        V += w_int * l
+        M += 0.5 * w_int * (l * l)
+
+    # Now add RB as a point reaction at x=L (upward).
+    # Its lever arm x - L is zero there, so it only closes the shear.
+    V[x >= L] += RB
+
+    return V, M
 
 
 def analyze_simply_supported(
@@ -146,88 +212,24 @@ def analyze_simply_supported(
     L = lc.span_m
     x = np.linspace(0.0, L, n_points)
 
-    RA, RB = _reactions_simply_supported(lc)
-
-    V = np.zeros_like(x)
-    M = np.zeros_like(x)
-
-    # Add reactions (upward)
-    V += RA
-    M += RA * x
-
-    V += RB * 0.0  # RB acts at x=L, accounted via point load term below
-
-    # Point loads (downward)
-    for pl in lc.point_loads:
-        P = pl.value_kN
-        a = pl.position_m
-        mask = x >= a
-        V[mask] += P  # P is negative if downward
-        M[mask] += P * (x[mask] - a)
-
-    # UDLs (downward)
-    # For each segment [a,b], intensity w
-    for w in lc.udls:
-        w_int = w.intensity_kN_per_m
-        a = w.start_m
-        b = w.end_m
-
-        # Three regions: x<a, a<=x<=b, x>b
-        mask1 = x >= a
-        mask2 = x >= b
-
-        # Region a <= x <= b: part of the UDL active up to x
-        x1 = x[mask1]
-        length_active = np.clip(x1 - a, 0.0, b - a)
-        V[mask1] += w_int * length_active
-        M[mask1] += w_int * 0.5 * length_active**2
-
-        # Region x > b: entire UDL is active
-        x2 = x[mask2]
-        Lw = b - a
-        V[mask2] += w_int * (Lw - length_active[mask2[mask1]])  # adjust overlap
-        # Simpler (and safer): recompute for x>b exactly
-        # but to keep it straightforward, we can handle separately:
-
-    # The simple way: recompute UDL effects cleanly
-    V = np.zeros_like(x)
-    M = np.zeros_like(x)
-
-    # Re-apply reactions
-    V += RA
-    M += RA * x
-
-    # Point loads again
-    for pl in lc.point_loads:
-        P = pl.value_kN
-        a = pl.position_m
-        mask = x >= a
-        V[mask] += P
-        M[mask] += P * (x[mask] - a)
-
-    # UDLs again (clean, piecewise)
-    for w in lc.udls:
-        w_int = w.intensity_kN_per_m
-        a = w.start_m
-        b = w.end_m
-        Lw = b - a
-
-        # For each x, we integrate w over the part of [a,b] that lies ≤ x.
-        for i, xi in enumerate(x):
-            if xi <= a:
-                continue
-            elif a < xi <= b:
-                l = xi - a
-            else:  # xi > b
-                l = Lw
-
-            V[i] += w_int * l
-            M[i] += w_int * 0.5 * l**2
-
-    # Now add RB as a point reaction at x=L (upward)
-    mask_RB = x >= L
-    V[mask_RB] += RB
-    M[mask_RB] += RB * (x[mask_RB] - L)
+    loads = _load_arrays(lc)
+    RA, RB = _reactions_simply_supported(L, loads)
+
+    has_point_loads = loads.pl_vals.size > 0
+    has_udls = loads.udl_w.size > 0
+
+    if _shear_moment is None:
+        V, M = _shear_moment_numpy(x, RA, RB, L, loads)
+    elif has_point_loads and has_udls:
+        V, M = _shear_moment(x, RA, RB, L, *loads)
+    elif has_udls:
+        V, M = _shear_moment_udl(x, RA, RB, L, loads.udl_w, loads.udl_a, loads.udl_b)
+    elif has_point_loads:
+        V, M = _shear_moment_point(x, RA, RB, L, loads.pl_vals, loads.pl_pos)
+    else:
+        # No loads, so no reactions, shear or moment
+        V = np.zeros_like(x)
+        M = np.zeros_like(x)
 
     return {
         "x_m": x,
@@ -238,3 +240,4 @@ def analyze_simply_supported(
         "RA_kN": RA,
         "RB_kN": RB,
     }
+
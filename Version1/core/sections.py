@@ -1,6 +1,7 @@
 # core/sections.py
 
 import csv
+from functools import lru_cache
 from pathlib import Path
 
 # This part defines the path to the materials CSV file
@@ -10,7 +11,10 @@ MATERIALS_CSV = PROJECT_ROOT / "data" / "materials.csv"
 # Density of steel in kg/m3
 STEEL_DENSITY = 7850.0 
 
-# This function loads the sections from the CSV file
+# This function loads the sections from the CSV file.
+# The file is parsed only once per process; later calls reuse the result,
+# so callers should treat the returned dicts as read-only.
+@lru_cache(maxsize=1)
 def load_sections():
     sections = {}
 
@@ -43,6 +47,7 @@ def load_sections():
     return sections
 
 # This function retrieves a specific section by name
+@lru_cache(maxsize=None)
 def get_section(name: str) -> dict:
     sections = load_sections()
 
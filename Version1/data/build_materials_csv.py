@@ -1,28 +1,43 @@
+import numpy as np
 import pandas as pd
 
-# Read raw Orange Book CSV (no headers)
-df = pd.read_csv("data/material.csv", header=None)
-
-# Keep only rows that start with IPE
-df = df[df[0].astype(str).str.startswith("IPE")].copy()
 
 # Columns we need (by index, based on Orange Book format)
 # 0  -> profile
 # 2  -> mass per metre [kg/m]
 # 15 -> Iy about y-y [cm^4]   (e.g. "278,000")
 # 19 -> Wel,y [cm^3]         (e.g. "7,140")
+#
+# Read raw Orange Book CSV (no headers), only these columns, as plain text.
+# Header and non-IPE rows can hold text here, so numbers are parsed only
+# after filtering, and strictly: a malformed value in an IPE row fails.
+df = pd.read_csv(
+    "data/material.csv",
+    header=None,
+    usecols=[0, 2, 15, 19],
+    dtype=str,
+    keep_default_na=False,
+)
+
+# Keep only rows that start with IPE
+df = df[df[0].str.startswith("IPE")]
+
+# Parse "278,000"-style numbers, one vectorized conversion per column.
+# Empty cells become NaN; astype(float) raises on anything malformed.
+for col in (2, 15, 19):
+    df[col] = (
+        df[col].str.strip().str.replace(",", "", regex=False)
+        .replace("", np.nan)
+        .astype(float)
+    )
 
 df_clean = pd.DataFrame()
 df_clean["profile"] = df[0]
-df_clean["mass_kg_per_m"] = df[2].astype(float)
+df_clean["mass_kg_per_m"] = df[2]
 
-# Remove commas and convert units
-df_clean["I_mm4"] = (
-    df[15].astype(str).str.replace(",", "").astype(float) * 1e4
-)
-df_clean["W_mm3"] = (
-    df[19].astype(str).str.replace(",", "").astype(float) * 1e3
-)
+# Convert units
+df_clean["I_mm4"] = df[15] * 1e4
+df_clean["W_mm3"] = df[19] * 1e3
 
 # Write final materials.csv
 df_clean.to_csv("data/materials.csv", index=False)
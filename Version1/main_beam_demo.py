@@ -2,9 +2,10 @@
 
 from pathlib import Path
 
+import numpy as np
+
 from core.loads import LoadCase, UDL, PointLoad, analyze_simply_supported
-from core.co2_calc import MaterialsDB, BeamSelection
-from core.deflection import max_deflection_simply_supported
+from core.co2_calc import MaterialsDB
 
 
 def main() -> None:
@@ -51,56 +52,34 @@ def main() -> None:
 
     db = MaterialsDB(data_path)
 
-    # Use all profiles from the materials table as candidates
-    candidate_profiles = db.df["profile"].tolist()
-
     fy_MPa = 355.0
     gamma_M0 = 1.0
-    deflection_limit_mm = (span * 1000.0) / 250.0
+    deflection_ratio = 250.0  # deflection limit L / 250
+    deflection_limit_mm = (span * 1000.0) / deflection_ratio
 
     print("\n=== Candidate beams (passing bending + deflection) ===")
 
-    candidates: list[dict] = []
-
-    for prof in candidate_profiles:
-        beam = BeamSelection(profile=prof, length_m=span)
-        summary = db.summary(beam)
-
-        # --- Bending capacity (ULS) ---
-        M_Rd = db.beam_M_Rd_kNm(beam, fy_MPa=fy_MPa, gamma_M0=gamma_M0)
-        utilization = M_Ed / M_Rd
-
-        # --- Deflection (SLS) ---
-        w_max_mm = max_deflection_simply_supported(
-            span_m=span,
-            I_cm4=summary["I_cm4"],
-            q_kN_per_m=q_SLS,
-            P_kN=P_SLS,
-        )
-        deflection_ok = w_max_mm <= deflection_limit_mm
-
-        candidates.append(
-            {
-                "profile": prof,
-                "M_Rd_kNm": M_Rd,
-                "utilization": utilization,
-                "w_max_mm": w_max_mm,
-                "deflection_ok": deflection_ok,
-                "mass_kg": summary["mass_kg"],
-                "co2_kg": summary["co2_kg"],
-            }
-        )
+    # Use all profiles from the materials table as candidates:
+    # bending capacity (ULS) and deflection (SLS) for every one at once
+    candidates = db.evaluate_candidates(
+        span_m=span,
+        M_Ed_kNm=M_Ed,
+        q_kN_per_m=q_SLS,
+        P_kN=P_SLS,
+        fy_MPa=fy_MPa,
+        gamma_M0=gamma_M0,
+        deflection_ratio=deflection_ratio,
+    )
 
    
     # 4) Filter + optimization
    
-    passing = [
-        c
-        for c in candidates
-        if c["utilization"] <= 1.0 and c["deflection_ok"]
-    ]
+    passing = np.flatnonzero(candidates["passes"])
+    order = passing[np.argsort(candidates["co2_kg"][passing], kind="stable")]
 
-    passing_sorted = sorted(passing, key=lambda c: c["co2_kg"])
+    passing_sorted = [
+        {key: col[i] for key, col in candidates.items()} for i in order
+    ]
 
     for c in passing_sorted:
         print(
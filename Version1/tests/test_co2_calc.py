@@ -0,0 +1,72 @@
+# tests/test_co2_calc.py
+import numpy as np
+import pytest
+
+from core.co2_calc import STEEL_CO2_KG_PER_KG, BeamSelection, MaterialsDB
+from core.deflection import max_deflection_simply_supported
+
+MATERIALS = """\
+profile,mass_kg_per_m,W_cm3,I_cm4
+IPE 200,22.4,194,1943
+IPE 300,42.2,557,8356
+IPE 360,57.1,904,16270
+IPE 400,66.3,1156,23130
+"""
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "materials.csv"
+    path.write_text(MATERIALS, encoding="utf-8")
+    return MaterialsDB(path)
+
+
+def test_single_profile_queries(db):
+    beam = BeamSelection(profile="IPE 300", length_m=6.0)
+    summary = db.summary(beam)
+
+    assert summary["mass_kg"] == pytest.approx(42.2 * 6.0)
+    assert summary["co2_kg"] == pytest.approx(42.2 * 6.0 * STEEL_CO2_KG_PER_KG)
+    assert db.beam_M_Rd_kNm(beam, fy_MPa=355.0) == pytest.approx(557 * 355 / 1000)
+
+    with pytest.raises(KeyError):
+        db.get_section_row("HEA 100")
+
+
+def test_evaluate_candidates_matches_per_profile_checks(db):
+    span, M_Ed, q, P = 6.0, 112.5, 15.0, 30.0
+    res = db.evaluate_candidates(span, M_Ed, q_kN_per_m=q, P_kN=P)
+
+    for i, profile in enumerate(res["profile"]):
+        beam = BeamSelection(profile=profile, length_m=span)
+        summary = db.summary(beam)
+        M_Rd = db.beam_M_Rd_kNm(beam)
+        w_max = max_deflection_simply_supported(span, summary["I_cm4"], q, P)
+
+        assert res["M_Rd_kNm"][i] == pytest.approx(M_Rd)
+        assert res["utilization"][i] == pytest.approx(M_Ed / M_Rd)
+        assert res["w_max_mm"][i] == pytest.approx(w_max)
+        assert res["co2_kg"][i] == pytest.approx(summary["co2_kg"])
+
+    np.testing.assert_array_equal(
+        res["passes"], [False, True, True, True]
+    )
+
+
+def test_reads_utf8_csv_with_bom(tmp_path):
+    # Excel's "CSV UTF-8" export starts the file with a byte order mark
+    path = tmp_path / "materials.csv"
+    path.write_text(MATERIALS, encoding="utf-8-sig")
+
+    db = MaterialsDB(path)
+    assert db.get_section_row("IPE 200")["I_cm4"] == 1943.0
+
+
+def test_blank_cells_are_nan_and_bad_values_are_reported(tmp_path):
+    path = tmp_path / "materials.csv"
+    path.write_text(MATERIALS + "IPE 100,8.1,34.2,\n", encoding="utf-8")
+    assert np.isnan(MaterialsDB(path).get_section_row("IPE 100")["I_cm4"])
+
+    path.write_text(MATERIALS + "IPE 100,8.1,abc,171\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="IPE 100.*W_cm3"):
+        MaterialsDB(path)
@@ -0,0 +1,160 @@
+# tests/test_loads.py
+import random
+
+import numpy as np
+import pytest
+
+from core import loads
+from core.loads import (
+    UDL,
+    LoadCase,
+    PointLoad,
+    analyze_simply_supported,
+    combine_load_cases,
+)
+
+
+def _reference(lc: LoadCase, n_points: int = 201):
+    """Plain per-point statics, written independently of core.loads."""
+    L = lc.span_m
+    x = np.linspace(0.0, L, n_points)
+    RB = 0.0
+    total = 0.0
+    for p in lc.point_loads:
+        total += p.value_kN
+        RB -= p.value_kN * p.position_m / L
+    for w in lc.udls:
+        W = w.intensity_kN_per_m * (w.end_m - w.start_m)
+        total += W
+        RB -= W * 0.5 * (w.start_m + w.end_m) / L
+    RA = -total - RB
+
+    V = np.empty_like(x)
+    M = np.empty_like(x)
+    for i, xi in enumerate(x):
+        v, m = RA, RA * xi
+        for p in lc.point_loads:
+            if xi >= p.position_m:
+                v += p.value_kN
+                m += p.value_kN * (xi - p.position_m)
+        for w in lc.udls:
+            l = min(max(xi - w.start_m, 0.0), w.end_m - w.start_m)
+            v += w.intensity_kN_per_m * l
+            m += 0.5 * w.intensity_kN_per_m * l * l
+        if xi >= L:
+            v += RB
+        V[i], M[i] = v, m
+    return RA, RB, V, M
+
+
+def _random_case(rng: random.Random, n_pl: int, n_udl: int) -> LoadCase:
+    L = rng.uniform(2.0, 12.0)
+    point_loads = [
+        PointLoad(value_kN=rng.uniform(-50.0, 10.0), position_m=rng.uniform(0.0, L))
+        for _ in range(n_pl)
+    ]
+    udls = []
+    for _ in range(n_udl):
+        a = rng.uniform(0.0, L)
+        udls.append(UDL(rng.uniform(-20.0, 5.0), start_m=a, end_m=rng.uniform(a, L)))
+    return LoadCase("G", L, point_loads=point_loads, udls=udls)
+
+
+# Load shapes: mixed, point loads only, UDLs only, no loads
+SHAPES = [(3, 2), (4, 0), (0, 3), (0, 0)]
+
+
+def test_closed_form_udl_and_midspan_point_load():
+    span = 6.0
+    lc = LoadCase(
+        "ULS",
+        span,
+        udls=[UDL(intensity_kN_per_m=-15.0, start_m=0.0, end_m=span)],
+        point_loads=[PointLoad(value_kN=-30.0, position_m=span / 2)],
+    )
+    res = analyze_simply_supported(lc)
+
+    assert res["RA_kN"] == pytest.approx(60.0)
+    assert res["RB_kN"] == pytest.approx(60.0)
+    assert res["M_max_kNm"] == pytest.approx(15.0 * span**2 / 8 + 30.0 * span / 4)
+    assert res["V_kN"][-1] == pytest.approx(0.0, abs=1e-9)
+
+
+@pytest.mark.parametrize("n_pl, n_udl", SHAPES)
+def test_matches_reference(n_pl, n_udl):
+    rng = random.Random(n_pl * 10 + n_udl)
+    for _ in range(50):
+        lc = _random_case(rng, n_pl, n_udl)
+        RA, RB, V, M = _reference(lc)
+        res = analyze_simply_supported(lc)
+
+        assert res["RA_kN"] == pytest.approx(RA, abs=1e-9)
+        assert res["RB_kN"] == pytest.approx(RB, abs=1e-9)
+        np.testing.assert_allclose(res["V_kN"], V, atol=1e-9)
+        np.testing.assert_allclose(res["M_kNm"], M, atol=1e-9)
+
+
+@pytest.mark.parametrize("n_pl, n_udl", SHAPES)
+def test_numpy_path_matches_reference(n_pl, n_udl, monkeypatch):
+    monkeypatch.setattr(loads, "_shear_moment", None)
+    rng = random.Random(100 + n_pl * 10 + n_udl)
+    for _ in range(50):
+        lc = _random_case(rng, n_pl, n_udl)
+        _, _, V, M = _reference(lc)
+        res = analyze_simply_supported(lc)
+
+        np.testing.assert_allclose(res["V_kN"], V, atol=1e-9)
+        np.testing.assert_allclose(res["M_kNm"], M, atol=1e-9)
+
+
+@pytest.mark.parametrize("n_pl, n_udl", SHAPES)
+def test_numba_kernels_match_numpy_path(n_pl, n_udl, monkeypatch):
+    pytest.importorskip("numba")
+    assert loads._shear_moment is not None
+
+    rng = random.Random(200 + n_pl * 10 + n_udl)
+    cases = [_random_case(rng, n_pl, n_udl) for _ in range(50)]
+    compiled = [analyze_simply_supported(lc) for lc in cases]
+
+    monkeypatch.setattr(loads, "_shear_moment", None)
+    for lc, res in zip(cases, compiled):
+        ref = analyze_simply_supported(lc)
+        np.testing.assert_allclose(res["V_kN"], ref["V_kN"], atol=1e-9)
+        np.testing.assert_allclose(res["M_kNm"], ref["M_kNm"], atol=1e-9)
+
+
+def test_loads_added_after_construction_are_analyzed():
+    lc = LoadCase("G", 6.0)
+    lc.point_loads.append(PointLoad(value_kN=-10.0, position_m=3.0))
+    assert analyze_simply_supported(lc)["M_max_kNm"] == pytest.approx(15.0)
+
+    lc.udls = [UDL(intensity_kN_per_m=-15.0, start_m=0.0, end_m=6.0)]
+    assert analyze_simply_supported(lc)["M_max_kNm"] == pytest.approx(
+        15.0 + 15.0 * 6.0**2 / 8.0
+    )
+
+
+def test_combine_load_cases():
+    G = LoadCase("G", 6.0, udls=[UDL(-5.0, 0.0, 6.0)], gamma=1.35)
+    Q = LoadCase("Q", 6.0, point_loads=[PointLoad(-10.0, 2.0)])
+    W = LoadCase("W", 6.0, point_loads=[PointLoad(-99.0, 1.0)])
+
+    combo = combine_load_cases([G, Q, W], {"G": 1.0, "Q": 1.5})
+
+    assert combo.point_loads == [PointLoad(value_kN=-15.0, position_m=2.0)]
+    assert combo.udls == [UDL(intensity_kN_per_m=-6.75, start_m=0.0, end_m=6.0)]
+    assert combo.gamma == 1.0
+
+    # The combined case is an ordinary LoadCase: later changes are analyzed
+    combo.point_loads.append(PointLoad(value_kN=-10.0, position_m=3.0))
+    expected = LoadCase("ref", 6.0, point_loads=combo.point_loads, udls=combo.udls)
+    assert analyze_simply_supported(combo)["M_max_kNm"] == pytest.approx(
+        analyze_simply_supported(expected)["M_max_kNm"]
+    )
+
+
+def test_combine_load_cases_rejects_bad_input():
+    with pytest.raises(ValueError):
+        combine_load_cases([], {})
+    with pytest.raises(ValueError):
+        combine_load_cases([LoadCase("G", 6.0), LoadCase("Q", 5.0)], {"G": 1.0})